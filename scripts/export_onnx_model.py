@@ -0,0 +1,47 @@
+import os
+from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+from optimum.onnxruntime.configuration import AutoQuantizationConfig
+
+def export_quantized_onnx_model(
+    model_dir="models/trained_news_classifier",
+    output_dir="models/trained_news_classifier_onnx"
+):
+    """
+    Exports the fine-tuned model to ONNX and applies dynamic INT8 quantization for CPU inference.
+    Only the quantized model is kept; the full-precision export is deleted afterwards.
+    """
+    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    full_model_dir = os.path.join(project_root, model_dir)
+    full_output_dir = os.path.join(project_root, output_dir)
+
+    if not os.path.exists(full_model_dir) or not os.listdir(full_model_dir):
+        print(f"Error: Trained model directory not found or empty at '{full_model_dir}'.")
+        print("Please ensure `model_training.py` was run successfully to save the model.")
+        return None
+
+    print(f"Exporting model from {full_model_dir} to ONNX...")
+    ort_model = ORTModelForSequenceClassification.from_pretrained(full_model_dir, export=True)
+    ort_model.save_pretrained(full_output_dir)
+
+    print("Applying dynamic INT8 quantization (AVX512-VNNI config)...")
+    quantizer = ORTQuantizer.from_pretrained(full_output_dir, file_name="model.onnx")
+    qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+    quantizer.quantize(save_dir=full_output_dir, quantization_config=qconfig)
+
+    # The ~250 MB FP32 export is only an intermediate; the app loads the quantized file
+    fp32_model_path = os.path.join(full_output_dir, "model.onnx")
+    if os.path.exists(fp32_model_path):
+        os.remove(fp32_model_path)
+        print(f"Removed full-precision intermediate: {fp32_model_path}")
+
+    quantized_model_path = os.path.join(full_output_dir, "model_quantized.onnx")
+    print(f"Quantized ONNX model saved to: {quantized_model_path}")
+    return quantized_model_path
+
+if __name__ == "__main__":
+    print("\n--- Running ONNX Export Script ---")
+    exported_file = export_quantized_onnx_model()
+    if exported_file:
+        print(f"ONNX export completed. Deploy {exported_file} and install optimum[onnxruntime] to serve it from the app.")
+    else:
+        print("ONNX export failed.")
@@ -1,13 +1,12 @@
-import streamlit as st
-import torch
-import numpy as np
 import os
+# Let the Rust tokenizer use its threadpool; must be set before transformers is imported
+os.environ.setdefault("TOKENIZERS_PARALLELISM", "true")
+import streamlit as st
 import pickle
-import pandas as pd
-from transformers import AutoModelForSequenceClassification, AutoTokenizer
+import sys
 import io
+import itertools
 import time
-import plotly.graph_objects as go
 
 # --- Streamlit App Configuration ---
 st.set_page_config(
@@ -103,14 +102,96 @@ st.markdown("""
     </div>
 """, unsafe_allow_html=True)
 
+# --- Heavy Imports ---
+# Deferred until the page config and header have been sent, so a cold start shows the UI immediately
+import torch
+import numpy as np
+import pandas as pd
+from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+# Add parent directory (nlp_news_pipeline) to sys.path to import utils; guarded since every rerun executes this
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+# Lives in an importable module so the JIT-compiled kernel stays in sys.modules across Streamlit reruns
+from utils.inference_utils import argmax_conf
+
 # --- Configuration Paths for Streamlit Cloud ---
 MODEL_DIR = "models/trained_news_classifier"
 LABEL_MAP_FILE = "models/label_map.pkl"
+# Inference precision: "auto" (FP16 on GPU, dynamic INT8 on CPU), "fp16"/"bf16" (GPU only), "int8" (CPU only) or "fp32"
+MODEL_PRECISION = os.environ.get("MODEL_PRECISION", "auto").lower()
+GPU_PRECISIONS = ("auto", "fp16", "bf16", "fp32")
+CPU_PRECISIONS = ("auto", "int8", "fp32")
+# torch.compile: "auto" compiles on CUDA only (reduce-overhead mode relies on CUDA graphs), "1" always, "0" never
+MODEL_COMPILE = os.environ.get("MODEL_COMPILE", "auto").lower()
+# CPU runtime: "auto"/"onnx" use the quantized ONNX model built by scripts/export_onnx_model.py when it
+# and `optimum[onnxruntime]` are installed (neither ships by default), "torch" forces PyTorch
+MODEL_BACKEND = os.environ.get("MODEL_BACKEND", "auto").lower()
+ONNX_DIR = "models/trained_news_classifier_onnx"
+ONNX_FILE = "model_quantized.onnx"
+# Upper bound on padded tokens per forward pass in the batch tab
+BATCH_TOKEN_BUDGET = 4096
+# Fixed padded sequence lengths; each batch is padded to the smallest tier that fits its longest text
+SEQ_LEN_TIERS = (32, 64, 128)
 
 # --- Model Loading ---
+def resolve_precision(device):
+    """Returns MODEL_PRECISION if the device supports it, otherwise warns and falls back to "auto"."""
+    supported = GPU_PRECISIONS if device.type == 'cuda' else CPU_PRECISIONS
+    # Pre-Ampere GPUs (e.g. T4) only emulate bf16, which is slower than fp16
+    if device.type == 'cuda' and not torch.cuda.is_bf16_supported():
+        supported = tuple(p for p in supported if p != "bf16")
+    if MODEL_PRECISION in supported:
+        return MODEL_PRECISION
+    st.warning(
+        f"MODEL_PRECISION='{MODEL_PRECISION}' is not supported on {device.type.upper()} "
+        f"(expected one of: {', '.join(supported)}). Using 'auto' instead."
+    )
+    return "auto"
+
+def compile_model(model, tokenizer, device):
+    """
+    Wraps the model with torch.compile and warms it up, which is when compilation actually happens.
+    Compiling is only a speed-up, so any failure falls back to the eager model instead of stopping the app.
+    """
+    try:
+        compiled_model = torch.compile(model, mode="reduce-overhead", fullgraph=False, dynamic=True)
+        # Two passes per shape: the first compiles, the second records the CUDA graph that later calls replay
+        warmup_model(compiled_model, tokenizer, device, passes=2)
+        return compiled_model
+    except Exception as e:
+        st.warning(f"torch.compile failed, running the model eagerly instead: {e}")
+        return model
+
+def load_onnx_model():
+    """Loads the pre-built INT8 ONNX Runtime model. Returns None if it or `optimum` is unavailable."""
+    onnx_path = os.path.join(ONNX_DIR, ONNX_FILE)
+    try:
+        if not os.path.exists(onnx_path):
+            raise FileNotFoundError(f"{onnx_path} not found; run scripts/export_onnx_model.py first")
+        from optimum.onnxruntime import ORTModelForSequenceClassification
+    except (FileNotFoundError, ImportError) as e:
+        # Only worth a warning when ONNX was asked for explicitly; "auto" quietly uses PyTorch INT8
+        if MODEL_BACKEND == "onnx":
+            st.warning(f"ONNX Runtime model unavailable, falling back to PyTorch: {e}")
+        return None
+
+    try:
+        return ORTModelForSequenceClassification.from_pretrained(ONNX_DIR, file_name=ONNX_FILE)
+    except Exception as e:
+        st.warning(f"ONNX Runtime model unavailable, falling back to PyTorch: {e}")
+        return None
+
 @st.cache_resource(show_spinner="Loading classification model...")
 def load_model_and_tokenizer():
-    """Loads the model, tokenizer, and label map."""
+    """Loads the model, tokenizer, label map and the index-ordered label names."""
+    # Return unused blocks held by PyTorch's caching allocator before loading. This cannot free tensors
+    # still referenced elsewhere (e.g. by a stale cache entry left behind after editing this function).
+    if torch.cuda.is_available():
+        torch.cuda.empty_cache()
+    # Allow TF32 matmuls on Ampere+ for any FP32 paths that remain
+    torch.set_float32_matmul_precision('high')
     if not os.path.exists(MODEL_DIR) or not os.path.exists(LABEL_MAP_FILE):
         st.error(
             f"**Error:** Model files not found. 🚨**\n\n"
@@ -123,38 +204,191 @@ def load_model_and_tokenizer():
         device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
         with open(LABEL_MAP_FILE, 'rb') as f:
             id_to_label = {v: k for k, v in pickle.load(f).items()}
-        tokenizer = AutoTokenizer.from_pretrained(MODEL_DIR)
-        model = AutoModelForSequenceClassification.from_pretrained(MODEL_DIR)
-        model.to(device)
-        model.eval()
-        return model, tokenizer, id_to_label, device
+        # Label names ordered by class index, so predictions index them directly
+        label_names = tuple(id_to_label[i] for i in sorted(id_to_label))
+        # Trigger the Numba JIT compile now; the dispatcher survives reruns, so later clicks reuse it
+        argmax_conf(np.zeros((1, len(label_names)), np.float32))
+        tokenizer = AutoTokenizer.from_pretrained(MODEL_DIR, use_fast=True)
+        precision = resolve_precision(device)
+        # ONNX Runtime serves CPU deployments; PyTorch stays the GPU path and the fallback.
+        # The ONNX model is INT8, so it is skipped when another precision (fp32) was asked for.
+        model = None
+        if device.type == 'cpu' and MODEL_BACKEND in ("auto", "onnx") and precision in ("auto", "int8"):
+            model = load_onnx_model()
+        if model is None:
+            model = AutoModelForSequenceClassification.from_pretrained(MODEL_DIR)
+            model.to(device)
+            model.eval()
+            if device.type == 'cuda':
+                if precision == "bf16":
+                    model.to(torch.bfloat16)
+                elif precision in ("auto", "fp16"):
+                    model.half()
+            elif precision in ("auto", "int8"):
+                model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+            use_compile = MODEL_COMPILE == "1" or (MODEL_COMPILE == "auto" and device.type == 'cuda')
+            if use_compile and hasattr(torch, "compile"):
+                compiled_model = compile_model(model, tokenizer, device)
+                if compiled_model is not model:
+                    # compile_model has already warmed every shape
+                    return compiled_model, tokenizer, id_to_label, label_names, device
+        warmup_model(model, tokenizer, device)
+        return model, tokenizer, id_to_label, label_names, device
     except Exception as e:
         st.error(f"An error occurred during model loading: {e}")
         st.stop()
 
-model, tokenizer, id_to_label, device = load_model_and_tokenizer()
-
 # --- Core Functions ---
-def predict_category(text_list, loaded_model, loaded_tokenizer, id_to_label_map, current_device):
-    """Predicts categories for a list of texts."""
-    results = []
-    if not text_list: return results
-    for text in text_list:
-        if not isinstance(text, str) or not text.strip():
-            results.append({"text": text, "predicted_category": "Invalid/Empty", "confidence": 0.0, "raw_probabilities": {}})
-            continue
-        inputs = loaded_tokenizer(text, return_tensors="pt", truncation=True, padding=True, max_length=128).to(current_device)
-        with torch.no_grad():
-            logits = loaded_model(**inputs).logits
-        probabilities = torch.nn.functional.softmax(logits, dim=-1)
-        predicted_label_idx = torch.argmax(probabilities, dim=-1).item()
-        results.append({
-            "text": text,
-            "predicted_category": id_to_label_map.get(predicted_label_idx, "Unknown"),
-            "confidence": probabilities[0, predicted_label_idx].item(),
-            "raw_probabilities": {id_to_label_map.get(i, f"L_{i}"): p for i, p in enumerate(probabilities.cpu().numpy().flatten())}
-        })
-    return results
+@torch.inference_mode()
+def encode_texts(text_list, loaded_tokenizer, current_device):
+    """Tokenizes the valid texts of a batch and moves them to the device. Returns (valid_idx, inputs)."""
+    valid_idx = [i for i, text in enumerate(text_list) if isinstance(text, str) and text.strip()]
+    if not valid_idx:
+        return valid_idx, None
+    inputs = loaded_tokenizer([text_list[i] for i in valid_idx], return_tensors="pt", truncation=True, padding=True, max_length=SEQ_LEN_TIERS[-1])
+    # Pad up to the next fixed length tier so compiled graphs and kernel plans only ever see a few shapes
+    seq_len = inputs['input_ids'].shape[1]
+    tier = next(t for t in SEQ_LEN_TIERS if t >= seq_len)
+    inputs = {
+        k: torch.nn.functional.pad(v, (0, tier - seq_len), value=loaded_tokenizer.pad_token_id if k == 'input_ids' else 0)
+        for k, v in inputs.items()
+    }
+    if current_device.type == 'cuda':
+        # Pinned host memory lets the copy overlap with whatever the GPU is still computing
+        return valid_idx, {k: v.pin_memory().to(current_device, non_blocking=True) for k, v in inputs.items()}
+    return valid_idx, {k: v.to(current_device) for k, v in inputs.items()}
+
+@torch.inference_mode()
+def launch_forward(loaded_model, inputs):
+    """Queues the forward pass and returns the (B, C) softmax probabilities, still on the device."""
+    logits = loaded_model(**inputs).logits
+    return torch.nn.functional.softmax(logits, dim=-1)
+
+def warmup_model(loaded_model, loaded_tokenizer, current_device, passes=1):
+    """
+    Runs launch_forward at every SEQ_LEN_TIERS length with batch sizes 1 and 2 (size-1 dims are always
+    specialized), so CUDA init, kernel autotuning and compilation happen at startup rather than on the first click.
+    """
+    for seq_len in SEQ_LEN_TIERS:
+        for batch_size in (1, 2):
+            inputs = loaded_tokenizer(["warmup text"] * batch_size, return_tensors="pt", padding="max_length", max_length=seq_len)
+            inputs = {k: v.to(current_device) for k, v in inputs.items()}
+            for _ in range(passes):
+                launch_forward(loaded_model, inputs)
+
+def collect_predictions(text_list, valid_idx, probs, label_names):
+    """
+    Copies a probability batch to the host in one transfer and scatters it into per-text arrays:
+    `prob_matrix` (B, C) float32, `preds` int64 (-1 for invalid/empty texts) and `conf` float32.
+    """
+    num_texts, num_classes = len(text_list), len(label_names)
+    prob_matrix = np.zeros((num_texts, num_classes), dtype=np.float32)
+    preds = np.full(num_texts, -1, dtype=np.int64)
+    conf = np.zeros(num_texts, dtype=np.float32)
+    if probs is not None:
+        probs_np = probs.float().to('cpu').numpy()
+        prob_matrix[valid_idx] = probs_np
+        preds[valid_idx], conf[valid_idx] = argmax_conf(probs_np)
+    return {"prob_matrix": prob_matrix, "preds": preds, "conf": conf}
+
+@torch.inference_mode()
+def predict_category(text_list, loaded_model, loaded_tokenizer, label_names, current_device):
+    """Predicts categories for a list of texts in a single batched forward pass."""
+    valid_idx, inputs = encode_texts(text_list, loaded_tokenizer, current_device)
+    probs = launch_forward(loaded_model, inputs) if inputs is not None else None
+    return collect_predictions(text_list, valid_idx, probs, label_names)
+
+def predict_pipelined(chunks, loaded_model, loaded_tokenizer, label_names, current_device):
+    """
+    Yields the predictions for each chunk in turn, tokenizing chunk N+1 on the CPU
+    while the device is still busy with chunk N.
+    """
+    pending = None
+    for chunk in chunks:
+        valid_idx, inputs = encode_texts(chunk, loaded_tokenizer, current_device)
+        if pending is not None:
+            yield collect_predictions(*pending, label_names)
+        pending = (chunk, valid_idx, launch_forward(loaded_model, inputs) if inputs is not None else None)
+    if pending is not None:
+        yield collect_predictions(*pending, label_names)
+
+# Loaded after the core functions because the loader warms the model up through launch_forward
+model, tokenizer, id_to_label, label_names, device = load_model_and_tokenizer()
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def predict_single_cached(text):
+    """
+    Cached single-article prediction, so re-classifying the same text skips the model.
+    The confidence threshold is applied by the caller and is deliberately not part of the cache key.
+    """
+    return predict_category([text], model, tokenizer, label_names, device)
+
+def build_results_df(texts, predictions, label_names):
+    """Builds the batch results dataframe column-wise from the prediction arrays."""
+    return pd.DataFrame({
+        'text': texts,
+        'predicted_category': [label_names[i] if i >= 0 else "Invalid/Empty" for i in predictions['preds']],
+        'confidence': predictions['conf'],
+        **{f'p_{name}': predictions['prob_matrix'][:, i] for i, name in enumerate(label_names)}
+    })
+
+def results_to_csv_bytes(results_df):
+    """Encodes the results dataframe as UTF-8 CSV bytes, using PyArrow's multi-threaded writer when available."""
+    buf = io.BytesIO()
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:
+        results_df.to_csv(buf, index=False, encoding='utf-8')
+        return buf.getvalue()
+    pacsv.write_csv(pa.Table.from_pandas(results_df, preserve_index=False), buf)
+    return buf.getvalue()
+
+# Bounded because every distinct upload from every session would otherwise stay in server memory
+@st.cache_data(show_spinner=False, max_entries=8, ttl=3600)
+def load_texts_from_upload(name, data, txt_limit=None):
+    """
+    Parses an uploaded TXT/CSV file into a list of texts, cached on the raw bytes so reruns skip the parse.
+    TXT reading stops one line past `txt_limit`; CSVs ignore it, so callers pass None for them to keep the
+    cache key independent of the batch size. Returns None if a CSV has no 'text' column.
+    """
+    if name.endswith('.txt'):
+        wrapper = io.TextIOWrapper(io.BytesIO(data), encoding='utf-8', errors='replace')
+        # The raw bytes are already in memory; decode lazily and stop one line past the cap
+        # so only the lines we keep are decoded and stripped
+        return list(itertools.islice((line for line in map(str.strip, wrapper) if line), txt_limit + 1 if txt_limit else None))
+    if name.endswith('.csv'):
+        try:
+            # Only parse the column we need; other columns are skipped without dtype inference
+            df = pd.read_csv(io.BytesIO(data), usecols=['text'], dtype={'text': 'string'}, engine='c')
+        except ValueError:
+            # Raised when 'text' is missing (among other parse issues); a full parse tells them apart
+            df = pd.read_csv(io.BytesIO(data))
+            if 'text' not in df.columns:
+                return None
+        return df['text'].dropna().astype(str).tolist()
+    return []
+
+def length_sorted_batches(texts, token_budget=BATCH_TOKEN_BUDGET):
+    """
+    Sorts texts by length and groups them so each batch pads to roughly `token_budget` tokens.
+    Returns the sort order and a list of (start, end) slices into the sorted texts.
+    """
+    lengths = np.fromiter((len(t) for t in texts), dtype=np.int32, count=len(texts))
+    order = np.argsort(lengths, kind="stable")
+    # Rough WordPiece estimate of ~4 characters per token, capped at the tokenizer's max_length
+    est_tokens = np.minimum(lengths[order] // 4 + 2, SEQ_LEN_TIERS[-1])
+    # encode_texts pads every batch up to a tier, so the budget has to be checked against the tier width
+    padded_width = np.asarray(SEQ_LEN_TIERS)[np.searchsorted(SEQ_LEN_TIERS, est_tokens)]
+    batches, start = [], 0
+    while start < len(order):
+        end = start + 1
+        # Texts are sorted ascending, so the newest member sets the padded width of the batch
+        while end < len(order) and (end - start + 1) * padded_width[end] <= token_budget:
+            end += 1
+        batches.append((start, end))
+        start = end
+    return order, batches
 
 def clear_inputs_and_results():
     """
@@ -164,6 +398,7 @@ def clear_inputs_and_results():
     st.session_state.text_input_single = ""
     # We use pop to safely remove the key if it exists, avoiding errors.
     st.session_state.pop('results_df', None)
+    st.session_state.pop('results_by_conf', None)
     # This resets the file uploader widget by changing its key
     st.session_state.uploader_key_counter += 1
 
@@ -218,23 +453,24 @@ with tab1:
             st.warning("Input is too short. Please provide more text.")
         else:
             with st.spinner("Classifying..."):
-                result = predict_category([user_input_single], model, tokenizer, id_to_label, device)[0]
+                result = predict_single_cached(user_input_single)
             st.subheader("Classification Result")
             # ... (rest of the tab logic is unchanged)
             col_result, col_probs = st.columns(2)
             with col_result:
-                category = result['predicted_category']
-                confidence = result['confidence']
+                category = label_names[result['preds'][0]]
+                confidence = float(result['conf'][0])
                 if confidence >= confidence_threshold:
                     st.success(f"**Category: {category}**")
                 else:
                     st.warning(f"**Category: {category}** (Confidence below threshold)")
                 st.metric("Confidence Score", f"{confidence:.2%}")
             with col_probs:
-                probs_df = pd.DataFrame(list(result['raw_probabilities'].items()), columns=['Category', 'Probability'])
-                probs_df = probs_df.sort_values(by='Probability', ascending=True)
+                import plotly.graph_objects as go
+                probs = result['prob_matrix'][0]
+                order = np.argsort(probs)
                 fig = go.Figure(go.Bar(
-                    x=probs_df['Probability'], y=probs_df['Category'], orientation='h', marker_color='#3498db'
+                    x=probs[order], y=[label_names[i] for i in order], orientation='h', marker_color='#3498db'
                 ))
                 fig.update_layout(
                     title="Probability Distribution", xaxis_title="Probability", yaxis_title="", height=250,
@@ -256,39 +492,53 @@ with tab2:
     if uploaded_file:
         # ... (rest of the tab logic is unchanged)
         try:
-            if uploaded_file.name.endswith('.txt'):
-                texts = [line.decode("utf-8").strip() for line in uploaded_file if line.strip()]
-            elif uploaded_file.name.endswith('.csv'):
-                df = pd.read_csv(uploaded_file)
-                if 'text' not in df.columns:
-                    st.error("CSV file must contain a 'text' column.")
-                    st.stop()
-                texts = df['text'].dropna().astype(str).tolist()
-            st.info(f"Found **{len(texts)}** articles in the file.")
+            txt_limit = max_batch_size if uploaded_file.name.endswith('.txt') else None
+            texts = load_texts_from_upload(uploaded_file.name, uploaded_file.getvalue(), txt_limit)
+            if texts is None:
+                st.error("CSV file must contain a 'text' column.")
+                st.stop()
+            # Capped TXT reads stop one line past the limit, so only CSVs know their exact total
+            total = f"more than {max_batch_size}" if txt_limit is not None and len(texts) > max_batch_size else len(texts)
+            st.info(f"Found **{total}** articles in the file.")
             if len(texts) > max_batch_size:
-                st.warning(f"File contains {len(texts)} articles. Only processing the first **{max_batch_size}** as per settings.")
+                st.warning(f"File contains {total} articles. Only processing the first **{max_batch_size}** as per settings.")
                 texts = texts[:max_batch_size]
-            if st.button(f"📊 Run Analysis on {len(texts)} Articles", use_container_width=True, type="primary"):
+            if texts and st.button(f"📊 Run Analysis on {len(texts)} Articles", use_container_width=True, type="primary"):
                 progress_bar = st.progress(0, text="Starting batch analysis...")
-                results = []
-                num_chunks = max(1, (len(texts) // 10))
-                for i, text_chunk in enumerate(np.array_split(texts, num_chunks)):
-                    results.extend(predict_category(text_chunk.tolist(), model, tokenizer, id_to_label, device))
-                    progress_bar.progress((i + 1) / num_chunks, f"Processing... {len(results)}/{len(texts)} articles classified.")
+                order, batches = length_sorted_batches(texts)
+                sorted_texts = [texts[j] for j in order]
+                chunk_predictions, num_done = [], 0
+                chunks = (sorted_texts[start:end] for start, end in batches)
+                for i, chunk_pred in enumerate(predict_pipelined(chunks, model, tokenizer, label_names, device)):
+                    chunk_predictions.append(chunk_pred)
+                    num_done += len(chunk_pred['preds'])
+                    progress_bar.progress((i + 1) / len(batches), f"Processing... {num_done}/{len(texts)} articles classified.")
+                # Scatter results back into the original file order
+                inv = np.empty_like(order)
+                inv[order] = np.arange(len(order))
+                predictions = {k: np.concatenate([c[k] for c in chunk_predictions])[inv] for k in chunk_predictions[0]}
                 progress_bar.empty()
                 st.success("Batch analysis complete!")
-                st.session_state.results_df = pd.DataFrame(results)
+                results_df = build_results_df(texts, predictions, label_names)
+                st.session_state.results_df = results_df
+                # Sorted once here so each threshold change is a binary search instead of a full-frame filter
+                by_conf = np.argsort(predictions['conf'], kind='stable')
+                st.session_state.results_by_conf = (predictions['conf'][by_conf], results_df['predicted_category'].to_numpy()[by_conf])
         except Exception as e:
             st.error(f"Error processing file: {e}")
 
     if 'results_df' in st.session_state:
         st.subheader("Analysis Results")
         results_df = st.session_state.results_df
-        filtered_df = results_df[results_df['confidence'] >= confidence_threshold]
-        category_counts = filtered_df['predicted_category'].value_counts()
+        conf_sorted, cats_sorted = st.session_state.results_by_conf
+        # Articles at or above the threshold form a suffix of the confidence-sorted arrays
+        cats, counts = np.unique(cats_sorted[np.searchsorted(conf_sorted, confidence_threshold):], return_counts=True)
+        order = np.argsort(-counts, kind='stable')
+        category_counts = pd.Series(counts[order], index=pd.Index(cats[order], name='Category'), name='Count')
         if not category_counts.empty:
             col_chart, col_summary = st.columns(2)
             with col_chart:
+                import plotly.graph_objects as go
                 fig = go.Figure(go.Bar(
                     x=category_counts.index, y=category_counts.values, marker_color=['#3498db', '#e74c3c', '#2ecc71', '#f1c40f']
                 ))
@@ -299,8 +549,8 @@ with tab2:
                 )
                 st.plotly_chart(fig, use_container_width=True)
             with col_summary:
-                st.dataframe(category_counts.reset_index().rename(columns={'index': 'Category', 'predicted_category': 'Count'}), use_container_width=True)
-            csv = results_df.to_csv(index=False).encode('utf-8')
+                st.dataframe(category_counts.reset_index(), use_container_width=True)
+            csv = results_to_csv_bytes(results_df)
             st.download_button(
                 "📥 Download Full Results (CSV)", csv, 'news_classification_results.csv', 'text/csv', use_container_width=True
             )
@@ -311,7 +561,7 @@ with tab3:
     st.header("🧠 Model & App Details")
     st.markdown(f"""
     This app uses a **DistilBERT** model fine-tuned for multi-class text classification on the **AG News** dataset.
-    It classifies articles into one of four categories: **{', '.join(id_to_label.values())}**.
+    It classifies articles into one of four categories: **{', '.join(label_names)}**.
     - **Device In Use:** `{device.type.upper()}`
     - **Model Source:** Hugging Face Transformers
     - **Frontend:** Streamlit
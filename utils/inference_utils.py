@@ -0,0 +1,25 @@
+import numpy as np
+
+try:
+    from numba import njit
+
+    @njit(cache=True, fastmath=True)
+    def argmax_conf(prob_matrix):
+        """Returns the per-row argmax and its probability for a (B, C) matrix in a single pass."""
+        n, c = prob_matrix.shape
+        idx = np.empty(n, np.int64)
+        conf = np.empty(n, np.float32)
+        for i in range(n):
+            m, mv = 0, prob_matrix[i, 0]
+            for j in range(1, c):
+                if prob_matrix[i, j] > mv:
+                    mv = prob_matrix[i, j]
+                    m = j
+            idx[i] = m
+            conf[i] = mv
+        return idx, conf
+except ImportError:
+    def argmax_conf(prob_matrix):
+        """Returns the per-row argmax and its probability for a (B, C) matrix."""
+        idx = prob_matrix.argmax(axis=1)
+        return idx, prob_matrix[np.arange(len(idx)), idx]